@@ -9,6 +9,7 @@ from treehouse.telemetry import ExecutionTrace, NodeExecution, TraceCollector
 from treehouse.visualization import (
     format_timeline,
     format_trace,
+    iter_format_trace,
     print_timeline,
     print_trace,
 )
@@ -25,6 +26,7 @@ __all__ = [
     "calculate_metrics",
     "format_timeline",
     "format_trace",
+    "iter_format_trace",
     "print_timeline",
     "print_trace",
 ]
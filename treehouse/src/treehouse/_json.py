@@ -0,0 +1,58 @@
+"""JSON encoding helpers.
+
+Uses orjson when it is installed (it ships with the ``visualizer`` extra)
+and falls back to the standard library otherwise. The output is not
+identical between the two:
+
+- orjson writes non-ASCII characters as raw UTF-8, while the standard
+  library escapes them (``\\u00e9``). Write the result to files as UTF-8.
+- orjson writes NaN and Infinity as ``null``, while the standard library
+  writes the non-standard ``NaN``/``Infinity`` tokens.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize obj to a JSON string.
+
+    Args:
+        obj: The object to serialize.
+        indent: Whether to pretty-print with two-space indentation.
+
+    Returns:
+        The JSON document as a string.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option).decode()
+        except TypeError:
+            # Values orjson rejects (e.g. integers over 64 bits) may still be
+            # representable by the standard library.
+            pass
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize a JSON document.
+
+    Args:
+        data: JSON text or UTF-8 encoded bytes.
+
+    Returns:
+        The decoded Python object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import heapq
+import math
 from collections import defaultdict
 from typing import Any
 
@@ -30,6 +32,24 @@ def _llm_present(execution: NodeExecution) -> bool:
     return False
 
 
+def _top_indices(keyed: list[tuple[float, int]], top_n: int) -> list[int]:
+    """Return the indices of the ``top_n`` largest keys.
+
+    ``keyed`` holds ``(key, -index)`` pairs so that ties keep their original
+    order. A heap selection is used when ``top_n`` is small relative to the
+    input; otherwise a full sort is cheaper.
+    """
+    if top_n <= 0 or not keyed:
+        return []
+    count = len(keyed)
+    if count > 1 and top_n * math.log2(count) < count:
+        selected = heapq.nlargest(top_n, keyed)
+    else:
+        keyed.sort(reverse=True)
+        selected = keyed[:top_n]
+    return [-neg_index for _, neg_index in selected]
+
+
 def calculate_metrics(trace: ExecutionTrace, top_n: int = 5) -> dict[str, Any]:
     """Calculate summary metrics for an execution trace.
 
@@ -76,14 +96,18 @@ def calculate_metrics(trace: ExecutionTrace, top_n: int = 5) -> dict[str, Any]:
         if execution.llm_cost is not None:
             total_cost += execution.llm_cost
 
-        node_type = execution.node_type
-        by_node_type[node_type]["count"] += 1
-        by_node_type[node_type]["duration_ms"] += execution.duration_ms
-        by_node_type[node_type]["cost"] += execution.llm_cost or 0.0
-        by_node_type[node_type]["tokens"]["prompt"] += tokens["prompt"]
-        by_node_type[node_type]["tokens"]["completion"] += tokens["completion"]
-        by_node_type[node_type]["tokens"]["total"] += tokens["total"]
-
+        slot = by_node_type[execution.node_type]
+        slot["count"] += 1
+        slot["duration_ms"] += execution.duration_ms
+        slot["cost"] += execution.llm_cost or 0.0
+        slot_tokens = slot["tokens"]
+        slot_tokens["prompt"] += tokens["prompt"]
+        slot_tokens["completion"] += tokens["completion"]
+        slot_tokens["total"] += tokens["total"]
+
+    cost_keys = [
+        (e.llm_cost, -i) for i, e in enumerate(executions) if (e.llm_cost or 0.0) > 0
+    ]
     top_cost_nodes = [
         {
             "node_id": e.node_id,
@@ -92,12 +116,12 @@ def calculate_metrics(trace: ExecutionTrace, top_n: int = 5) -> dict[str, Any]:
             "cost": e.llm_cost or 0.0,
             "duration_ms": e.duration_ms,
         }
-        for e in executions
-        if (e.llm_cost or 0.0) > 0
+        for e in (executions[i] for i in _top_indices(cost_keys, top_n))
     ]
-    top_cost_nodes.sort(key=lambda item: item["cost"], reverse=True)
-    top_cost_nodes = top_cost_nodes[:top_n]
 
+    duration_keys = [
+        (e.duration_ms, -i) for i, e in enumerate(executions) if e.duration_ms > 0
+    ]
     top_duration_nodes = [
         {
             "node_id": e.node_id,
@@ -106,11 +130,8 @@ def calculate_metrics(trace: ExecutionTrace, top_n: int = 5) -> dict[str, Any]:
             "duration_ms": e.duration_ms,
             "status": e.status,
         }
-        for e in executions
-        if e.duration_ms > 0
+        for e in (executions[i] for i in _top_indices(duration_keys, top_n))
     ]
-    top_duration_nodes.sort(key=lambda item: item["duration_ms"], reverse=True)
-    top_duration_nodes = top_duration_nodes[:top_n]
 
     return {
         "trace_id": trace.trace_id,
@@ -8,20 +8,26 @@ This module provides:
 
 from __future__ import annotations
 
-import json
+import sys
 import uuid
+from collections import deque
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import chain
 
 from vivarium import Event
 
+from . import _json
 
-@dataclass
+
+@dataclass(slots=True, weakref_slot=True)
 class NodeExecution:
     """Represents a single node execution event in a behavior tree.
 
     This dataclass captures telemetry data for node execution, enabling
     observation and analysis of behavior tree performance and decisions.
+    It uses __slots__ since collectors may hold thousands of instances.
 
     Attributes:
         node_id: Unique identifier for the node instance.
@@ -55,6 +61,13 @@ class NodeExecution:
     llm_cost: float | None = None
     llm_model: str | None = None
 
+    def __post_init__(self) -> None:
+        # These values come from a small vocabulary that repeats across every
+        # tick, so share one string object per distinct value.
+        self.node_type = sys.intern(self.node_type)
+        self.path_in_tree = sys.intern(self.path_in_tree)
+        self.status = sys.intern(self.status)
+
     def __repr__(self) -> str:
         """Return a debug-friendly representation of the node execution."""
         base = (
@@ -127,7 +140,7 @@ class NodeExecution:
         )
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class ExecutionTrace:
     """A complete execution trace from a single behavior tree tick.
 
@@ -166,7 +179,7 @@ class ExecutionTrace:
 
     def to_json(self) -> str:
         """Convert trace to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return _json.dumps(self.to_dict(), indent=True)
 
     @classmethod
     def from_dict(cls, data: dict) -> ExecutionTrace:
@@ -190,7 +203,7 @@ class ExecutionTrace:
     @classmethod
     def from_json(cls, json_str: str) -> ExecutionTrace:
         """Create trace from JSON string."""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(_json.loads(json_str))
 
 
 class TraceCollector:
@@ -215,17 +228,28 @@ class TraceCollector:
     stream events to the visualizer server.
     """
 
-    def __init__(self, debugger=None):
+    def __init__(self, debugger=None, max_traces: int | None = None):
         """Initialize the TraceCollector.
 
         Args:
             debugger: Optional DebuggerClient for streaming events to visualizer.
+            max_traces: Optional cap on the number of completed traces kept.
+                When reached, the oldest trace is discarded. Unbounded if None.
         """
         self._pending: dict[str, Event] = {}  # path_in_tree -> start event
         self._current_trace: ExecutionTrace | None = None
-        self._traces: list[ExecutionTrace] = []
+        self._traces: deque[ExecutionTrace] = deque(maxlen=max_traces)
         self._state: dict | None = None  # Reference to state for LLM data extraction
         self._debugger = debugger  # Optional DebuggerClient
+        # event_type -> handler; detail events (action_invoked,
+        # action_completed, condition_evaluated) are not needed since the
+        # lifecycle is tracked via node_entered/exited.
+        self._handlers = {
+            "tick_started": self._start_trace,
+            "tick_completed": self._complete_trace,
+            "node_entered": self._enter_node,
+            "node_exited": self._complete_node,
+        }
 
     def set_state(self, state: dict) -> None:
         """Set the state reference for LLM data extraction.
@@ -250,18 +274,9 @@ class TraceCollector:
 
         This method implements the EventEmitter protocol.
         """
-        match event.event_type:
-            case "tick_started":
-                self._start_trace(event)
-            case "tick_completed":
-                self._complete_trace(event)
-            case "node_entered":
-                self._pending[event.path_in_tree] = event
-            case "node_exited":
-                self._complete_node(event)
-            case "action_invoked" | "action_completed" | "condition_evaluated":
-                # Detail events; lifecycle tracked via node_entered/exited
-                pass
+        handler = self._handlers.get(event.event_type)
+        if handler is not None:
+            handler(event)
 
     def _start_trace(self, event: Event) -> None:
         """Start a new trace for this tick."""
@@ -284,6 +299,8 @@ class TraceCollector:
 
     def _complete_trace(self, event: Event) -> None:
         """Complete the current trace."""
+        # Entries left unmatched by this tick can never be completed now.
+        self._pending.clear()
         if self._current_trace is not None:
             self._current_trace.end_time = event.timestamp
             self._current_trace.status = event.payload.get("result", "unknown")
@@ -301,6 +318,10 @@ class TraceCollector:
 
             self._current_trace = None
 
+    def _enter_node(self, event: Event) -> None:
+        """Remember the start event until the matching node_exited arrives."""
+        self._pending[event.path_in_tree] = event
+
     def _complete_node(self, end_event: Event) -> None:
         """Match end event with start event to compute duration."""
         start_event = self._pending.pop(end_event.path_in_tree, None)
@@ -352,6 +373,8 @@ class TraceCollector:
         if self._state is None:
             return {}
 
+        # The state is read on every call (not snapshotted in set_state)
+        # because LLM nodes write their data into it during the tick.
         llm_key = f"_llm_{node_id}"
         llm_data = self._state.get(llm_key)
 
@@ -375,12 +398,16 @@ class TraceCollector:
             "llm_model": data.get("model"),
         }
 
+    def iter_executions(self) -> Iterator[NodeExecution]:
+        """Iterate over all executions from completed traces, oldest first.
+
+        Unlike get_executions(), no intermediate list is built.
+        """
+        return chain.from_iterable(trace.executions for trace in self._traces)
+
     def get_executions(self) -> list[NodeExecution]:
         """Return all executions from completed traces."""
-        executions = []
-        for trace in self._traces:
-            executions.extend(trace.executions)
-        return executions
+        return list(self.iter_executions())
 
     def get_trace(self) -> ExecutionTrace | None:
         """Return the most recent completed trace, or None."""
@@ -388,7 +415,7 @@ class TraceCollector:
 
     def get_traces(self) -> list[ExecutionTrace]:
         """Return all completed traces."""
-        return self._traces.copy()
+        return list(self._traces)
 
     def clear(self) -> None:
         """Clear all collected traces and pending events."""
@@ -7,9 +7,10 @@ chronological timeline view.
 
 from __future__ import annotations
 
+import functools
 import os
 import sys
-from io import StringIO
+from collections.abc import Iterator
 from typing import TextIO
 
 from .telemetry import ExecutionTrace, NodeExecution
@@ -46,18 +47,29 @@ def _supports_color(file: TextIO) -> bool:
     return False
 
 
+_STATUS_COLORS = {
+    "success": Colors.GREEN,
+    "failure": Colors.RED,
+    "running": Colors.YELLOW,
+}
+
+_ICONS_PLAIN = {"success": "✓", "failure": "✗", "running": "⏸"}
+_ICONS_COLOR = {
+    status: f"{_STATUS_COLORS[status]}{icon}{Colors.RESET}"
+    for status, icon in _ICONS_PLAIN.items()
+}
+_UNKNOWN_ICON_PLAIN = "?"
+_UNKNOWN_ICON_COLOR = f"{Colors.DIM}?{Colors.RESET}"
+
+# Indentation strings for common tree depths, indexed by depth.
+_INDENTS = tuple("    " * depth for depth in range(64))
+
+
 def _status_icon(status: str, use_color: bool = True) -> str:
     """Return a status icon with optional color."""
-    icons = {
-        "success": ("✓", Colors.GREEN),
-        "failure": ("✗", Colors.RED),
-        "running": ("⏸", Colors.YELLOW),
-    }
-    icon, color = icons.get(status, ("?", Colors.DIM))
-
     if use_color:
-        return f"{color}{icon}{Colors.RESET}"
-    return icon
+        return _ICONS_COLOR.get(status, _UNKNOWN_ICON_COLOR)
+    return _ICONS_PLAIN.get(status, _UNKNOWN_ICON_PLAIN)
 
 
 def _format_duration(duration_ms: float) -> str:
@@ -107,15 +119,64 @@ def _get_depth(path: str) -> int:
     return path.count("/")
 
 
+@functools.lru_cache(maxsize=4096)
 def _get_node_name(path: str) -> str:
-    """Extract the node name from a path, removing index suffixes."""
+    """Extract the node name from a path, removing index suffixes.
+
+    Results are cached since the same paths repeat on every tick.
+    """
     if not path:
         return ""
-    name = path.split("/")[-1]
-    # Remove index like [0], [1], etc.
-    if "[" in name:
-        name = name.split("[")[0]
-    return name
+    # Take the last segment and drop any index like [0], [1], etc.
+    return path.rpartition("/")[2].partition("[")[0]
+
+
+def iter_format_trace(
+    trace: ExecutionTrace,
+    use_color: bool = False,
+    show_duration: bool = True,
+    show_path: bool = False,
+    show_llm: bool = True,
+) -> Iterator[str]:
+    """Yield the lines of a formatted execution trace, one at a time.
+
+    Same output as format_trace, but lines are produced lazily (without
+    trailing newlines) so large traces can be streamed to a file.
+
+    Args:
+        trace: The ExecutionTrace to format.
+        use_color: Whether to include ANSI colors.
+        show_duration: Whether to show execution duration for each node.
+        show_path: Whether to show the full path instead of just the name.
+        show_llm: Whether to show LLM prompt/response for LLM nodes.
+
+    Yields:
+        Formatted output lines.
+    """
+    # Header
+    total_duration = 0.0
+    if trace.start_time and trace.end_time:
+        total_duration = (trace.end_time - trace.start_time).total_seconds() * 1000
+
+    status_str = _status_icon(trace.status, use_color)
+    duration_str = f" ({_format_duration(total_duration)})" if show_duration else ""
+
+    if use_color:
+        yield (
+            f"{Colors.BOLD}Trace #{trace.tick_id}{Colors.RESET} "
+            f"[{status_str}]{duration_str}"
+        )
+    else:
+        yield f"Trace #{trace.tick_id} [{trace.status}]{duration_str}"
+
+    if not trace.executions:
+        yield "  (no executions)"
+        return
+
+    # Build tree structure from flat executions
+    yield from _iter_executions_as_tree(
+        trace.executions, use_color, show_duration, show_path, show_llm
+    )
 
 
 def print_trace(
@@ -148,52 +209,36 @@ def print_trace(
     if use_color is None:
         use_color = _supports_color(file)
 
-    # Header
-    total_duration = 0.0
-    if trace.start_time and trace.end_time:
-        total_duration = (trace.end_time - trace.start_time).total_seconds() * 1000
-
-    status_str = _status_icon(trace.status, use_color)
-    duration_str = f" ({_format_duration(total_duration)})" if show_duration else ""
-
-    if use_color:
-        header = (
-            f"{Colors.BOLD}Trace #{trace.tick_id}{Colors.RESET} "
-            f"[{status_str}]{duration_str}"
+    # Render fully first so the stream sees one write instead of one per line.
+    file.write(
+        format_trace(
+            trace,
+            use_color=use_color,
+            show_duration=show_duration,
+            show_path=show_path,
+            show_llm=show_llm,
         )
-    else:
-        header = f"Trace #{trace.tick_id} [{trace.status}]{duration_str}"
-
-    print(header, file=file)
-
-    if not trace.executions:
-        print("  (no executions)", file=file)
-        return
-
-    # Build tree structure from flat executions
-    _print_executions_as_tree(
-        trace.executions, file, use_color, show_duration, show_path, show_llm
     )
 
 
-def _print_executions_as_tree(
+def _iter_executions_as_tree(
     executions: list[NodeExecution],
-    file: TextIO,
     use_color: bool,
     show_duration: bool,
     show_path: bool,
     show_llm: bool = True,
-) -> None:
-    """Print executions with tree-like indentation."""
+) -> Iterator[str]:
+    """Yield execution lines with tree-like indentation."""
+    # Depths are needed for both the current row and the look-ahead, so
+    # compute them once up front.
+    depths = [_get_depth(execution.path_in_tree) for execution in executions]
+    last = len(executions) - 1
     for i, execution in enumerate(executions):
-        depth = _get_depth(execution.path_in_tree)
-        is_last = i == len(executions) - 1 or (
-            i + 1 < len(executions)
-            and _get_depth(executions[i + 1].path_in_tree) <= depth
-        )
+        depth = depths[i]
+        is_last = i == last or depths[i + 1] <= depth
 
         # Build prefix
-        indent = "    " * depth
+        indent = _INDENTS[depth] if depth < 64 else "    " * depth
         connector = "└── " if is_last else "├── "
 
         # Node info
@@ -216,22 +261,20 @@ def _print_executions_as_tree(
         else:
             type_str = f"[{node_type}]"
 
-        line = f"{indent}{connector}{name} {type_str} {status}{duration}"
-        print(line, file=file)
+        yield f"{indent}{connector}{name} {type_str} {status}{duration}"
 
         # Show LLM data if present and enabled
         if show_llm and execution.has_llm_data:
-            _print_llm_data(execution, file, use_color, indent, is_last)
+            yield from _iter_llm_data(execution, use_color, indent, is_last)
 
 
-def _print_llm_data(
+def _iter_llm_data(
     execution: NodeExecution,
-    file: TextIO,
     use_color: bool,
     parent_indent: str,
     is_last_node: bool,
-) -> None:
-    """Print LLM execution data for a node."""
+) -> Iterator[str]:
+    """Yield LLM execution data lines for a node."""
     # Continue the tree line if not last node
     continuation = "    " if is_last_node else "│   "
     indent = parent_indent + continuation
@@ -243,35 +286,28 @@ def _print_llm_data(
 
     if use_color:
         model_str = f"{Colors.CYAN}{model}{Colors.RESET}"
-        info_line = (
+        yield (
             f"{indent}    {Colors.DIM}{model_str} | "
             f"{tokens_str} | {cost_str}{Colors.RESET}"
         )
     else:
-        info_line = f"{indent}    [{model}] {tokens_str} | {cost_str}"
-    print(info_line, file=file)
+        yield f"{indent}    [{model}] {tokens_str} | {cost_str}"
 
     # Prompt (truncated)
     if execution.llm_prompt:
         prompt_preview = _truncate(execution.llm_prompt, 60)
         if use_color:
-            print(
-                f"{indent}    {Colors.DIM}Prompt: {prompt_preview}{Colors.RESET}",
-                file=file,
-            )
+            yield f"{indent}    {Colors.DIM}Prompt: {prompt_preview}{Colors.RESET}"
         else:
-            print(f"{indent}    Prompt: {prompt_preview}", file=file)
+            yield f"{indent}    Prompt: {prompt_preview}"
 
     # Response (truncated)
     if execution.llm_response:
         response_preview = _truncate(execution.llm_response, 60)
         if use_color:
-            print(
-                f"{indent}    {Colors.DIM}Response: {response_preview}{Colors.RESET}",
-                file=file,
-            )
+            yield f"{indent}    {Colors.DIM}Response: {response_preview}{Colors.RESET}"
         else:
-            print(f"{indent}    Response: {response_preview}", file=file)
+            yield f"{indent}    Response: {response_preview}"
 
 
 def print_timeline(
@@ -304,6 +340,16 @@ def print_timeline(
     if use_color is None:
         use_color = _supports_color(file)
 
+    # Render fully first so the stream sees one write instead of one per line.
+    file.write(format_timeline(trace, use_color=use_color, bar_width=bar_width))
+
+
+def _iter_timeline(
+    trace: ExecutionTrace,
+    use_color: bool,
+    bar_width: int,
+) -> Iterator[str]:
+    """Yield the lines of a formatted timeline."""
     # Calculate total duration
     total_duration = 0.0
     if trace.start_time and trace.end_time:
@@ -312,56 +358,50 @@ def print_timeline(
     # Header
     duration_fmt = _format_duration(total_duration)
     if use_color:
-        header = (
+        yield (
             f"{Colors.BOLD}Timeline for Trace #{trace.tick_id}{Colors.RESET} "
             f"({duration_fmt} total)"
         )
     else:
-        header = f"Timeline for Trace #{trace.tick_id} ({duration_fmt} total)"
+        yield f"Timeline for Trace #{trace.tick_id} ({duration_fmt} total)"
 
-    print(header, file=file)
-    print("─" * (bar_width + 30), file=file)
+    yield "─" * (bar_width + 30)
 
     if not trace.executions:
-        print("  (no executions)", file=file)
+        yield "  (no executions)"
         return
 
     # Find max name length for alignment
-    max_name_len = max(len(_get_node_name(e.path_in_tree)) for e in trace.executions)
+    names = [_get_node_name(e.path_in_tree) for e in trace.executions]
+    max_name_len = max(len(name) for name in names)
     max_name_len = min(max_name_len, 20)  # Cap at 20 chars
 
-    # Find max duration for scaling
-    max_duration = max((e.duration_ms for e in trace.executions), default=1.0)
-    if max_duration == 0:
-        max_duration = 1.0  # Avoid division by zero
+    # Build full-width bars once; each row takes slices of them.
+    fill_char, empty_char = ("█", "░") if use_color else ("#", "-")
+    filled, empty = fill_char * bar_width, empty_char * bar_width
 
-    for execution in trace.executions:
-        name = _get_node_name(execution.path_in_tree)[:max_name_len].ljust(max_name_len)
+    for execution, name in zip(trace.executions, names, strict=True):
+        label = name[:max_name_len].ljust(max_name_len)
 
         # Calculate bar length
         if total_duration > 0:
             bar_len = int((execution.duration_ms / total_duration) * bar_width)
         else:
             bar_len = 0
+        # Keep slices in range for durations outside [0, total_duration].
+        bar_len = max(0, min(bar_len, bar_width))
 
         # Choose bar color based on status
         if use_color:
-            bar_color = {
-                "success": Colors.GREEN,
-                "failure": Colors.RED,
-                "running": Colors.YELLOW,
-            }.get(execution.status, Colors.DIM)
-            bar = (
-                f"{bar_color}{'█' * bar_len}{Colors.RESET}{'░' * (bar_width - bar_len)}"
-            )
+            bar_color = _STATUS_COLORS.get(execution.status, Colors.DIM)
+            bar = f"{bar_color}{filled[:bar_len]}{Colors.RESET}{empty[bar_len:]}"
         else:
-            bar = f"{'#' * bar_len}{'-' * (bar_width - bar_len)}"
+            bar = f"{filled[:bar_len]}{empty[bar_len:]}"
 
         duration = _format_duration(execution.duration_ms).rjust(8)
         status = _status_icon(execution.status, use_color)
 
-        line = f"{name} [{bar}] {duration} {status}"
-        print(line, file=file)
+        yield f"{label} [{bar}] {duration} {status}"
 
 
 def format_trace(
@@ -385,16 +425,14 @@ def format_trace(
     Returns:
         Formatted string representation of the trace.
     """
-    buffer = StringIO()
-    print_trace(
+    lines = iter_format_trace(
         trace,
-        file=buffer,
         use_color=use_color,
         show_duration=show_duration,
         show_path=show_path,
         show_llm=show_llm,
     )
-    return buffer.getvalue()
+    return "\n".join(lines) + "\n"
 
 
 def format_timeline(
@@ -414,6 +452,4 @@ def format_timeline(
     Returns:
         Formatted string representation of the timeline.
     """
-    buffer = StringIO()
-    print_timeline(trace, file=buffer, use_color=use_color, bar_width=bar_width)
-    return buffer.getvalue()
+    return "\n".join(_iter_timeline(trace, use_color, bar_width)) + "\n"
@@ -14,7 +14,6 @@ Or run directly:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
@@ -27,6 +26,7 @@ from fastapi import Body, FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 
+from treehouse import _json
 from treehouse.metrics import calculate_metrics
 from treehouse.telemetry import ExecutionTrace
 from treehouse.visualizer.storage import TraceStorage
@@ -45,7 +45,7 @@ class ConnectionManager:
     """
 
     # Viewer connections (browser clients watching execution)
-    viewers: list[WebSocket] = field(default_factory=list)
+    viewers: set[WebSocket] = field(default_factory=set)
     # Agent connections (behavior tree agents sending events)
     agents: dict[str, WebSocket] = field(default_factory=dict)
     agent_by_socket: dict[WebSocket, str] = field(default_factory=dict)
@@ -56,7 +56,7 @@ class ConnectionManager:
     async def connect_viewer(self, websocket: WebSocket) -> None:
         """Accept a new viewer connection."""
         await websocket.accept()
-        self.viewers.append(websocket)
+        self.viewers.add(websocket)
         logger.info(f"Viewer connected. Total viewers: {len(self.viewers)}")
 
         await websocket.send_json(
@@ -122,7 +122,7 @@ class ConnectionManager:
     def disconnect_viewer(self, websocket: WebSocket) -> None:
         """Remove a viewer connection."""
         if websocket in self.viewers:
-            self.viewers.remove(websocket)
+            self.viewers.discard(websocket)
             logger.info(f"Viewer disconnected. Total viewers: {len(self.viewers)}")
 
     def disconnect_agent(self, websocket: WebSocket) -> None:
@@ -146,29 +146,32 @@ class ConnectionManager:
             )
 
     async def broadcast_to_viewers(self, message: dict[str, Any]) -> None:
-        """Send a message to all connected viewers."""
-        disconnected = []
-        for viewer in self.viewers:
-            try:
-                await viewer.send_json(message)
-            except Exception:
-                disconnected.append(viewer)
+        """Send a message to all connected viewers concurrently."""
+        # Encode once rather than letting every socket re-serialize it.
+        payload = _json.dumps(message)
+        viewers = list(self.viewers)
+        results = await asyncio.gather(
+            *(viewer.send_text(payload) for viewer in viewers),
+            return_exceptions=True,
+        )
 
         # Clean up disconnected viewers
-        for viewer in disconnected:
-            self.disconnect_viewer(viewer)
+        for viewer, result in zip(viewers, results, strict=True):
+            if isinstance(result, Exception):
+                self.disconnect_viewer(viewer)
 
     async def broadcast_to_agents(
         self, message: dict[str, Any], agent_id: str | None = None
     ) -> None:
         """Send a message to all connected agents."""
+        payload = _json.dumps(message)
         if agent_id:
             agent = self.agents.get(agent_id)
             if not agent:
                 logger.warning(f"Agent not found for command: {agent_id}")
                 return
             try:
-                await agent.send_json(message)
+                await agent.send_text(payload)
                 logger.info(f"✅ Sent to agent {agent_id} successfully")
             except Exception as e:
                 logger.error(f"❌ Failed to send to agent {agent_id}: {e}")
@@ -176,20 +179,20 @@ class ConnectionManager:
             return
 
         logger.info(f"📤 Broadcasting to {len(self.agents)} agent(s): {message}")
-        disconnected_ids = []
-        for agent_id, agent in list(self.agents.items()):
-            try:
-                await agent.send_json(message)
-                logger.info("✅ Sent to agent successfully")
-            except Exception as e:
-                logger.error(f"❌ Failed to send to agent: {e}")
-                disconnected_ids.append(agent_id)
+        agents = list(self.agents.items())
+        results = await asyncio.gather(
+            *(agent.send_text(payload) for _, agent in agents),
+            return_exceptions=True,
+        )
 
         # Clean up disconnected agents
-        for agent_id in disconnected_ids:
-            agent = self.agents.get(agent_id)
-            if agent:
-                self.disconnect_agent(agent)
+        for (agent_id, agent), result in zip(agents, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"❌ Failed to send to agent: {result}")
+                if self.agents.get(agent_id) is agent:
+                    self.disconnect_agent(agent)
+            else:
+                logger.info("✅ Sent to agent successfully")
 
     async def _handle_agent_hello(self, agent_id: str, event: dict[str, Any]) -> bool:
         if event.get("type") != "agent_hello":
@@ -303,6 +306,11 @@ def _save_trace_state(trace_state: dict[str, Any]) -> None:
         logger.exception("Failed to save trace")
 
 
+def _json_response(content: Any) -> Response:
+    """Return pre-encoded JSON, skipping FastAPI's jsonable_encoder walk."""
+    return Response(content=_json.dumps(content), media_type="application/json")
+
+
 # Global connection manager
 manager = ConnectionManager()
 storage = TraceStorage()
@@ -338,11 +346,13 @@ async def health_check():
 @app.get("/api/traces")
 async def list_traces(limit: int = 50, offset: int = 0):
     """List stored traces."""
-    return {
-        "traces": storage.list_traces(limit=limit, offset=offset),
-        "limit": limit,
-        "offset": offset,
-    }
+    return _json_response(
+        {
+            "traces": storage.list_traces(limit=limit, offset=offset),
+            "limit": limit,
+            "offset": offset,
+        }
+    )
 
 
 @app.get("/api/traces/{trace_id}")
@@ -351,7 +361,7 @@ async def get_trace(trace_id: str):
     trace = storage.get_trace(trace_id)
     if trace is None:
         raise HTTPException(status_code=404, detail="Trace not found")
-    return trace.to_dict()
+    return _json_response(trace.to_dict())
 
 
 @app.get("/api/traces/{trace_id}/export")
@@ -434,8 +444,7 @@ async def viewer_websocket(websocket: WebSocket):
     try:
         while True:
             # Viewers can send debugger commands
-            data = await websocket.receive_text()
-            message = json.loads(data)
+            message = _json.loads(await websocket.receive_text())
             logger.info(f"📨 Viewer sent: {message}")
 
             # Forward debugger commands to agents
@@ -464,8 +473,7 @@ async def agent_websocket(websocket: WebSocket):
     agent_id = await manager.connect_agent(websocket)
     try:
         while True:
-            data = await websocket.receive_text()
-            event = json.loads(data)
+            event = _json.loads(await websocket.receive_text())
             logger.info(
                 f"📥 Server received from agent: {event.get('type', 'unknown')}"
             )
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -30,16 +33,42 @@ class TraceStorage:
         if db_path is None:
             db_path = Path.home() / ".treehouse" / "traces.db"
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if str(db_path) != ":memory:":
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One long-lived connection, shared across threads under a lock, saves
+        # reopening the database (and its WAL files) on every operation. It is
+        # also what keeps an in-memory database alive. The lock serializes
+        # everything, so a read waits for any write in progress.
+        self._lock = threading.Lock()
+        self._conn = self._open()
         self._init_db()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+    def _open(self) -> sqlite3.Connection:
+        # sqlite3.connect's default 5s timeout doubles as the busy timeout.
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
+        # WAL makes a commit an append instead of a journal rewrite, so
+        # NORMAL sync is durable enough and skips an fsync per commit.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
         return conn
 
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Hold the shared connection for one transaction."""
+        with self._lock, self._conn:
+            yield self._conn
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
     def _init_db(self) -> None:
         with self._connect() as conn:
+            # Persisted in the database file; makes commits cheaper (see
+            # _open). In-memory databases keep their own journal mode.
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS traces (
                     trace_id TEXT PRIMARY KEY,
@@ -51,6 +80,11 @@ class TraceStorage:
                     metadata_json TEXT
                 )
                 """)
+            # Lets list_traces walk the newest traces without sorting the table.
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_traces_start_time "
+                "ON traces(start_time DESC)"
+            )
 
     def save_trace(self, trace: ExecutionTrace) -> None:
         trace_dict = trace.to_dict()
@@ -144,12 +178,12 @@ class TraceStorage:
             return False
 
         output_path = Path(output_path)
-        output_path.write_text(trace.to_json())
+        output_path.write_text(trace.to_json(), encoding="utf-8")
         return True
 
     def import_trace_json(self, input_path: str | Path) -> ExecutionTrace:
         input_path = Path(input_path)
-        trace = ExecutionTrace.from_json(input_path.read_text())
+        trace = ExecutionTrace.from_json(input_path.read_text(encoding="utf-8"))
         self.save_trace(trace)
         return trace
 
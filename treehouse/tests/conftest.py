@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import pytest
+
+from treehouse.visualizer.storage import TraceStorage
+
+
+@pytest.fixture(scope="module")
+def _memory_storage():
+    storage = TraceStorage(db_path=":memory:")
+    yield storage
+    storage.close()
+
+
+@pytest.fixture
+def storage(_memory_storage):
+    """In-memory TraceStorage shared per module and emptied after each test."""
+    yield _memory_storage
+    with _memory_storage._connect() as conn:
+        conn.execute("DELETE FROM traces")
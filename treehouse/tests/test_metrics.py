@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime, timedelta
 
 from treehouse.metrics import calculate_metrics
 from treehouse.telemetry import ExecutionTrace, NodeExecution
 
+_PROTO = NodeExecution(
+    node_id="",
+    node_name="",
+    node_type="Action",
+    path_in_tree="",
+    timestamp=datetime(2026, 1, 1),
+    status="success",
+    duration_ms=0.0,
+)
+
 
 def _execution(
     *,
@@ -17,19 +28,20 @@ def _execution(
     llm_cost: float | None = None,
     llm_model: str | None = None,
 ) -> NodeExecution:
-    return NodeExecution(
+    has_llm = bool(llm_tokens or llm_cost or llm_model)
+    return replace(
+        _PROTO,
         node_id=node_id,
         node_name=node_id,
         node_type=node_type,
         path_in_tree=path_in_tree,
-        timestamp=datetime.now(),
         status=status,
         duration_ms=duration_ms,
         llm_tokens=llm_tokens,
         llm_cost=llm_cost,
         llm_model=llm_model,
-        llm_prompt="prompt" if llm_tokens or llm_cost or llm_model else None,
-        llm_response="response" if llm_tokens or llm_cost or llm_model else None,
+        llm_prompt="prompt" if has_llm else None,
+        llm_response="response" if has_llm else None,
     )
 
 
@@ -205,3 +217,23 @@ def test_llm_present_with_only_model():
     metrics = calculate_metrics(trace)
     # Should count as LLM call
     assert metrics["llm_call_count"] == 1
+
+
+def test_top_nodes_keep_order_for_ties_and_large_top_n():
+    """Rankings should be stable for ties whichever selection path is used."""
+    executions = [
+        _execution(
+            node_id=f"a{i}",
+            node_type="Action",
+            path_in_tree=f"root/a{i}",
+            duration_ms=10 if i % 2 else 20,
+        )
+        for i in range(6)
+    ]
+    trace = ExecutionTrace(tick_id=4, status="success", executions=executions)
+
+    small = calculate_metrics(trace, top_n=1)["top_duration_nodes"]
+    large = calculate_metrics(trace, top_n=10)["top_duration_nodes"]
+
+    assert [item["node_id"] for item in small] == ["a0"]
+    assert [item["node_id"] for item in large] == ["a0", "a2", "a4", "a1", "a3", "a5"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from datetime import datetime, timedelta, timezone
 
 from treehouse.telemetry import ExecutionTrace, NodeExecution
@@ -46,10 +47,31 @@ def test_trace_storage_save_get_list_delete(tmp_path):
 
     assert storage.delete_trace(trace.trace_id) is True
     assert storage.get_trace(trace.trace_id) is None
+    storage.close()
 
 
-def test_trace_storage_export_import(tmp_path):
+def test_trace_storage_file_database_uses_wal(tmp_path):
     storage = TraceStorage(db_path=tmp_path / "traces.db")
+
+    with storage._connect() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # NORMAL is 1.
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    storage.close()
+
+
+def test_trace_storage_lists_traces_without_sorting(storage):
+    with storage._connect() as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT trace_id FROM traces "
+            "ORDER BY start_time DESC LIMIT 10"
+        ).fetchall()
+    details = " ".join(row["detail"] for row in plan)
+    assert "idx_traces_start_time" in details
+    assert "TEMP B-TREE" not in details
+
+
+def test_trace_storage_export_import(storage, tmp_path):
     trace = _trace("trace-export")
     storage.save_trace(trace)
 
@@ -61,12 +83,53 @@ def test_trace_storage_export_import(tmp_path):
     assert storage.get_trace(imported.trace_id) is not None
 
 
-def test_trace_storage_export_missing_trace(tmp_path):
-    storage = TraceStorage(db_path=tmp_path / "traces.db")
+def test_trace_storage_export_import_non_ascii_metadata(storage, tmp_path):
+    trace = _trace("trace-unicode")
+    trace.metadata = {"prompt": "héllo 🤖 你好"}
+    storage.save_trace(trace)
+
+    export_path = tmp_path / "trace.json"
+    assert storage.export_trace_json(trace.trace_id, export_path) is True
+    imported = storage.import_trace_json(export_path)
+
+    assert imported.metadata == {"prompt": "héllo 🤖 你好"}
+
+
+def test_trace_storage_export_missing_trace(storage, tmp_path):
     export_path = tmp_path / "missing.json"
     assert storage.export_trace_json("missing", export_path) is False
 
 
+def test_trace_storage_in_memory_save_get_list_delete(storage):
+    trace = _trace("trace-memory")
+
+    storage.save_trace(trace)
+
+    stored = storage.get_trace(trace.trace_id)
+    assert stored is not None
+    assert stored.trace_id == trace.trace_id
+    assert [item["trace_id"] for item in storage.list_traces()] == [trace.trace_id]
+
+    assert storage.delete_trace(trace.trace_id) is True
+    assert storage.get_trace(trace.trace_id) is None
+
+
+def test_trace_storage_shares_connection_across_threads(tmp_path):
+    storage = TraceStorage(db_path=tmp_path / "traces.db")
+
+    def save(index: int) -> None:
+        storage.save_trace(_trace(f"trace-{index}"))
+
+    threads = [threading.Thread(target=save, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(storage.list_traces(limit=20)) == 8
+    storage.close()
+
+
 def test_parse_timestamp_handles_empty():
     assert parse_timestamp(None) is None
 
@@ -1,9 +1,13 @@
 """Tests for treehouse telemetry module."""
 
+import weakref
 from datetime import datetime, timedelta, timezone
 
 import pytest
 from vivarium import (
+    Action,
+    ActionCompleted,
+    ActionInvoked,
     BehaviorTree,
     NodeEntered,
     NodeExited,
@@ -13,7 +17,7 @@ from vivarium import (
     TickStarted,
 )
 
-from treehouse import ExecutionTrace, NodeExecution, TraceCollector
+from treehouse import ExecutionTrace, NodeExecution, TraceCollector, _json
 
 # --- NodeExecution Tests ---
 
@@ -39,6 +43,43 @@ def test_node_execution_has_required_fields():
     assert execution.duration_ms == 10.5
 
 
+def test_node_execution_uses_slots():
+    """NodeExecution should not carry a per-instance __dict__ but allow weakrefs."""
+    execution = NodeExecution(
+        node_id="test_node",
+        node_name="Test Node",
+        node_type="Action",
+        path_in_tree="root/test_node",
+        timestamp=datetime.now(timezone.utc),
+        status="success",
+        duration_ms=1.0,
+    )
+    assert not hasattr(execution, "__dict__")
+    assert weakref.ref(execution)() is execution
+
+
+def test_node_execution_interns_repeated_strings():
+    """Equal node types, paths, and statuses should share one string object."""
+    now = datetime.now(timezone.utc)
+    first, second = (
+        NodeExecution.from_dict(
+            {
+                "node_id": "work",
+                "node_name": "work",
+                "node_type": "".join(["Act", "ion"]),
+                "path_in_tree": "".join(["root/", "work"]),
+                "timestamp": now.isoformat(),
+                "status": "".join(["succ", "ess"]),
+                "duration_ms": 1.0,
+            }
+        )
+        for _ in range(2)
+    )
+    assert first.node_type is second.node_type
+    assert first.path_in_tree is second.path_in_tree
+    assert first.status is second.status
+
+
 def test_node_execution_repr():
     """NodeExecution repr should include path."""
     now = datetime.now(timezone.utc)
@@ -98,6 +139,7 @@ def test_node_execution_from_dict_roundtrip():
     assert restored.status == original.status
     assert restored.duration_ms == original.duration_ms
     assert restored.start_time == original.start_time
+    assert restored == original
 
 
 def test_node_execution_with_llm_data():
@@ -197,6 +239,7 @@ def test_execution_trace_has_required_fields():
     assert trace.tick_id == 1
     assert trace.executions == []
     assert trace.metadata == {}
+    assert not hasattr(trace, "__dict__")
 
 
 def test_execution_trace_to_json_roundtrip():
@@ -232,6 +275,24 @@ def test_execution_trace_to_json_roundtrip():
     assert restored.metadata == {"key": "value"}
 
 
+def test_execution_trace_json_roundtrip_without_orjson(monkeypatch):
+    """ExecutionTrace JSON should fall back to the standard library."""
+    monkeypatch.setattr(_json, "orjson", None)
+    now = datetime.now(timezone.utc)
+    original = ExecutionTrace(
+        trace_id="fallback",
+        tick_id=2,
+        start_time=now,
+        end_time=now,
+        status="failure",
+        metadata={"key": "value"},
+    )
+
+    restored = ExecutionTrace.from_json(original.to_json())
+
+    assert restored.to_dict() == original.to_dict()
+
+
 # --- TraceCollector Tests ---
 
 
@@ -257,123 +318,75 @@ def test_trace_collector_creates_trace_on_tick_events():
     assert trace.end_time is not None
 
 
-def test_trace_collector_computes_duration_from_paired_events():
-    """TraceCollector should compute duration from node_entered/exited."""
-    collector = TraceCollector()
-
+@pytest.fixture
+def collector():
+    return TraceCollector()
+
+
+@pytest.mark.parametrize(
+    ("node_id", "node_type", "path_in_tree", "result", "expected_status"),
+    [
+        pytest.param(
+            "heal", "Action", "root/heal", NodeStatus.SUCCESS, "success", id="action"
+        ),
+        pytest.param(
+            "main_seq",
+            "Sequence",
+            "main_seq",
+            NodeStatus.SUCCESS,
+            "success",
+            id="composite",
+        ),
+        pytest.param(
+            "is_healthy",
+            "Condition",
+            "root/is_healthy",
+            NodeStatus.SUCCESS,
+            "success",
+            id="condition_true",
+        ),
+        pytest.param(
+            "is_dead",
+            "Condition",
+            "root/is_dead",
+            NodeStatus.FAILURE,
+            "failure",
+            id="condition_false",
+        ),
+    ],
+)
+def test_trace_collector_records_paired_node_events(
+    collector, node_id, node_type, path_in_tree, result, expected_status
+):
+    """TraceCollector should build an execution from node_entered/exited."""
     collector.emit(TickStarted(tick_id=1))
     collector.emit(
         NodeEntered(
             tick_id=1,
-            node_id="heal",
-            node_type="Action",
-            path_in_tree="root/heal",
+            node_id=node_id,
+            node_type=node_type,
+            path_in_tree=path_in_tree,
         )
     )
     collector.emit(
         NodeExited(
             tick_id=1,
-            node_id="heal",
-            node_type="Action",
-            path_in_tree="root/heal",
-            result=NodeStatus.SUCCESS,
+            node_id=node_id,
+            node_type=node_type,
+            path_in_tree=path_in_tree,
+            result=result,
         )
     )
-    collector.emit(TickCompleted(tick_id=1, result=NodeStatus.SUCCESS))
+    collector.emit(TickCompleted(tick_id=1, result=result))
 
     trace = collector.get_trace()
     assert len(trace.executions) == 1
-    assert trace.executions[0].node_id == "heal"
-    assert trace.executions[0].status == "success"
+    execution = trace.executions[0]
+    assert execution.node_id == node_id
+    assert execution.node_type == node_type
+    assert execution.status == expected_status
     # Duration should be >= 0 (timestamps are very close in tests)
-    assert trace.executions[0].duration_ms >= 0
-
-
-def test_trace_collector_handles_node_entered_exited():
-    """TraceCollector should handle composite node events."""
-    collector = TraceCollector()
-
-    collector.emit(TickStarted(tick_id=1))
-    collector.emit(
-        NodeEntered(
-            tick_id=1,
-            node_id="main_seq",
-            node_type="Sequence",
-            path_in_tree="main_seq",
-        )
-    )
-    collector.emit(
-        NodeExited(
-            tick_id=1,
-            node_id="main_seq",
-            node_type="Sequence",
-            path_in_tree="main_seq",
-            result=NodeStatus.SUCCESS,
-        )
-    )
-    collector.emit(TickCompleted(tick_id=1, result=NodeStatus.SUCCESS))
-
-    trace = collector.get_trace()
-    assert len(trace.executions) == 1
-    assert trace.executions[0].node_type == "Sequence"
-
-
-def test_trace_collector_handles_condition_evaluated():
-    """TraceCollector should handle condition lifecycle events."""
-    collector = TraceCollector()
-
-    collector.emit(TickStarted(tick_id=1))
-    collector.emit(
-        NodeEntered(
-            tick_id=1,
-            node_id="is_healthy",
-            node_type="Condition",
-            path_in_tree="root/is_healthy",
-        )
-    )
-    collector.emit(
-        NodeExited(
-            tick_id=1,
-            node_id="is_healthy",
-            node_type="Condition",
-            path_in_tree="root/is_healthy",
-            result=NodeStatus.SUCCESS,
-        )
-    )
-    collector.emit(TickCompleted(tick_id=1, result=NodeStatus.SUCCESS))
-
-    trace = collector.get_trace()
-    assert len(trace.executions) == 1
-    assert trace.executions[0].node_id == "is_healthy"
-    assert trace.executions[0].status == "success"
-
-
-def test_trace_collector_handles_false_condition():
-    """TraceCollector should convert FAILURE result to 'failure' status."""
-    collector = TraceCollector()
-
-    collector.emit(TickStarted(tick_id=1))
-    collector.emit(
-        NodeEntered(
-            tick_id=1,
-            node_id="is_dead",
-            node_type="Condition",
-            path_in_tree="root/is_dead",
-        )
-    )
-    collector.emit(
-        NodeExited(
-            tick_id=1,
-            node_id="is_dead",
-            node_type="Condition",
-            path_in_tree="root/is_dead",
-            result=NodeStatus.FAILURE,
-        )
-    )
-    collector.emit(TickCompleted(tick_id=1, result=NodeStatus.FAILURE))
-
-    trace = collector.get_trace()
-    assert trace.executions[0].status == "failure"
+    assert execution.duration_ms >= 0
 
 
 def test_trace_collector_multiple_ticks():
@@ -396,6 +409,18 @@ def test_trace_collector_multiple_ticks():
     assert traces[1].status == "failure"
 
 
+def test_trace_collector_max_traces_discards_oldest():
+    """TraceCollector should keep only the newest max_traces traces."""
+    collector = TraceCollector(max_traces=2)
+
+    for tick_id in range(1, 4):
+        collector.emit(TickStarted(tick_id=tick_id))
+        collector.emit(TickCompleted(tick_id=tick_id, result=NodeStatus.SUCCESS))
+
+    assert [trace.tick_id for trace in collector.get_traces()] == [2, 3]
+    assert collector.get_trace().tick_id == 3
+
+
 def test_trace_collector_get_executions():
     """TraceCollector.get_executions should return all executions."""
     collector = TraceCollector()
@@ -444,6 +469,7 @@ def test_trace_collector_get_executions():
     assert len(executions) == 2
     assert executions[0].node_id == "cond1"
     assert executions[1].node_id == "cond2"
+    assert list(collector.iter_executions()) == executions
 
 
 def test_trace_collector_clear():
@@ -541,6 +567,19 @@ def test_trace_collector_extract_llm_data_from_dict():
     assert llm_data["llm_model"] == "gpt-4"
 
 
+def test_trace_collector_extract_llm_data_written_after_set_state():
+    """LLM data stored in state during the tick should still be found."""
+    collector = TraceCollector()
+    state = {}
+    collector.set_state(state)
+    assert collector._extract_llm_data("task1") == {}
+
+    state["_llm_task1"] = {"prompt": "late", "response": "ok"}
+
+    llm_data = collector._extract_llm_data("task1")
+    assert llm_data["llm_prompt"] == "late"
+
+
 def test_trace_collector_extract_llm_data_from_object():
     """TraceCollector should extract LLM data from objects with to_dict."""
     collector = TraceCollector()
@@ -668,6 +707,43 @@ def test_trace_collector_with_debugger_streams_condition():
     assert "trace_complete" in event_types
 
 
+def test_trace_collector_streams_node_execution_before_tick_completes():
+    """Each node_execution should reach the debugger as soon as the node exits."""
+    collector = TraceCollector()
+
+    class FakeDebugger:
+        def __init__(self):
+            self.events = []
+
+        def send_sync(self, event):
+            self.events.append(event)
+
+    debugger = FakeDebugger()
+    collector.set_debugger(debugger)
+
+    collector.emit(TickStarted(tick_id=1))
+    assert [e["type"] for e in debugger.events] == ["trace_start"]
+
+    collector.emit(
+        NodeEntered(
+            tick_id=1,
+            node_id="task1",
+            node_type="Action",
+            path_in_tree="root/task1",
+        )
+    )
+    collector.emit(
+        NodeExited(
+            tick_id=1,
+            node_id="task1",
+            node_type="Action",
+            path_in_tree="root/task1",
+            result=NodeStatus.SUCCESS,
+        )
+    )
+    assert [e["type"] for e in debugger.events] == ["trace_start", "node_execution"]
+
+
 def test_trace_collector_orphaned_node_exited():
     """TraceCollector should handle node_exited without node_entered."""
     collector = TraceCollector()
@@ -692,6 +768,24 @@ def test_trace_collector_orphaned_node_exited():
     assert trace.executions[0].duration_ms == 0.0
 
 
+def test_trace_collector_drops_unmatched_entries_on_tick_completed():
+    """Unmatched node_entered events should not outlive their tick."""
+    collector = TraceCollector()
+
+    collector.emit(TickStarted(tick_id=1))
+    collector.emit(
+        NodeEntered(
+            tick_id=1,
+            node_id="aborted",
+            node_type="Action",
+            path_in_tree="root/aborted",
+        )
+    )
+    collector.emit(TickCompleted(tick_id=1, result=NodeStatus.FAILURE))
+
+    assert collector._pending == {}
+
+
 # --- Integration Tests ---
 
 
@@ -703,8 +797,6 @@ class SuccessAction:
 
     def tick(self, state, emitter=None, ctx=None):
         if emitter and ctx:
-            from vivarium import ActionCompleted, ActionInvoked
-
             node_ctx = ctx.child(self.name, "Action")
             emitter.emit(
                 ActionInvoked(
@@ -732,7 +824,6 @@ class SuccessAction:
 @pytest.mark.integration
 def test_trace_collector_with_vivarium_tree():
     """TraceCollector should work with a real Vivarium BehaviorTree."""
-    from vivarium import Action
 
     class SimpleAction(Action):
         def __init__(self, name: str):
@@ -17,6 +17,7 @@ from treehouse.visualization import (
     _truncate,
     format_timeline,
     format_trace,
+    iter_format_trace,
 )
 
 # --- Helper functions tests ---
@@ -46,6 +47,13 @@ def test_status_icon_unknown():
     assert icon == "?"
 
 
+def test_status_icon_with_color():
+    """Colored status icons should wrap the icon in its ANSI color."""
+    assert _status_icon("success") == "\033[32m✓\033[0m"
+    assert _status_icon("failure") == "\033[31m✗\033[0m"
+    assert _status_icon("unknown") == "\033[2m?\033[0m"
+
+
 def test_format_duration_submillisecond():
     """Durations under 1ms should show as <1ms."""
     assert _format_duration(0.5) == "<1ms"
@@ -272,6 +280,16 @@ def test_format_trace_nested_nodes():
     assert "    " in lines[3]  # heal is indented
 
 
+@pytest.mark.parametrize("depth", [3, 63, 64, 100])
+def test_format_trace_indents_by_depth(depth):
+    """format_trace should indent four spaces per level at any depth."""
+    path = "/".join(["node"] * (depth + 1))
+    trace = _make_trace(executions=[(path, "Action", "success", 1.0)])
+    lines = format_trace(trace, use_color=False).split("\n")
+
+    assert lines[1].startswith(" " * (4 * depth) + "└── node")
+
+
 def test_format_timeline_output():
     trace = _make_trace(
         executions=[
@@ -365,6 +383,40 @@ def test_format_timeline_multiple_nodes():
     assert fast_line.count("#") < slow_line.count("#")
 
 
+def test_format_timeline_bars_keep_fixed_width():
+    """Bars should fill exactly bar_width, even if a node outlasts the trace."""
+    trace = _make_trace(
+        executions=[
+            ("half", "Action", "success", 50.0),
+            ("over", "Action", "success", 150.0),
+        ],
+        duration_ms=100.0,
+    )
+    output = format_timeline(trace, use_color=False, bar_width=20)
+    lines = output.strip().split("\n")
+
+    half_line = [ln for ln in lines if "half" in ln][0]
+    over_line = [ln for ln in lines if "over" in ln][0]
+    assert "[" + "#" * 10 + "-" * 10 + "]" in half_line
+    assert "[" + "#" * 20 + "]" in over_line
+
+
+def test_format_timeline_negative_duration_renders_empty_bar():
+    """A negative duration (e.g. clock skew) should render an empty bar."""
+    trace = _make_trace(
+        executions=[
+            ("skewed", "Action", "success", -5.0),
+            ("normal", "Action", "success", 100.0),
+        ],
+        duration_ms=100.0,
+    )
+    output = format_timeline(trace, use_color=False, bar_width=20)
+    lines = output.strip().split("\n")
+
+    skewed_line = [ln for ln in lines if "skewed" in ln][0]
+    assert "[" + "-" * 20 + "]" in skewed_line
+
+
 def test_format_timeline_status_icons():
     """format_timeline should show status icons."""
     trace = _make_trace(
@@ -424,6 +476,21 @@ def test_print_trace_with_custom_file():
     assert "Action" in output
 
 
+def test_iter_format_trace_matches_format_trace():
+    """iter_format_trace should yield the lines of format_trace."""
+    trace = _make_trace(
+        executions=[
+            ("sequence", "Sequence", "success", 30.0),
+            ("sequence/task", "Action", "failure", 20.0),
+        ],
+    )
+    lines = list(iter_format_trace(trace))
+
+    assert len(lines) == 3
+    assert all("\n" not in line for line in lines)
+    assert "\n".join(lines) + "\n" == format_trace(trace)
+
+
 def test_format_trace_without_color():
     """format_trace should format without color codes when use_color=False."""
     trace = _make_trace(
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import json
 from datetime import datetime, timedelta, timezone
 from typing import cast
 
@@ -36,10 +38,16 @@ def _trace(trace_id: str) -> ExecutionTrace:
 
 
 @pytest.fixture()
-def client(tmp_path, monkeypatch):
+def server_storage(tmp_path, monkeypatch):
     storage = TraceStorage(db_path=tmp_path / "traces.db")
     monkeypatch.setattr(server, "storage", storage)
-    server.manager.viewers = []
+    yield storage
+    storage.close()
+
+
+@pytest.fixture()
+def client(server_storage):
+    server.manager.viewers = set()
     server.manager.agents = {}
     server.manager.agent_by_socket = {}
     server.manager.agent_state = {}
@@ -56,7 +64,8 @@ def test_trace_api_roundtrip(client):
     trace_id = response.json()["trace_id"]
     response = client.get(f"/api/traces/{trace_id}")
     assert response.status_code == 200
-    assert response.json()["trace_id"] == trace_id
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == trace.to_dict()
 
     response = client.get("/api/traces?limit=10")
     assert response.status_code == 200
@@ -120,7 +129,7 @@ def test_metrics_from_invalid_state():
 
 
 def test_health_endpoint_counts(client):
-    server.manager.viewers = cast(list, [object(), object()])
+    server.manager.viewers = cast(set, {object(), object()})
     server.manager.agents = {"agent-1": object()}
 
     response = client.get("/health")
@@ -131,10 +140,7 @@ def test_health_endpoint_counts(client):
 
 
 @pytest.mark.asyncio
-async def test_connect_viewer_sends_state_and_metrics(tmp_path, monkeypatch):
-    storage = TraceStorage(db_path=tmp_path / "traces.db")
-    monkeypatch.setattr(server, "storage", storage)
-
+async def test_connect_viewer_sends_state_and_metrics(server_storage):
     manager = server.ConnectionManager()
     manager.agent_state = {
         "agent-1": {
@@ -172,20 +178,18 @@ async def test_connect_viewer_sends_state_and_metrics(tmp_path, monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_handle_agent_event_broadcasts_and_saves(tmp_path, monkeypatch):
-    storage = TraceStorage(db_path=tmp_path / "traces.db")
-    monkeypatch.setattr(server, "storage", storage)
+async def test_handle_agent_event_broadcasts_and_saves(server_storage):
     manager = server.ConnectionManager()
 
     class FakeViewer:
         def __init__(self) -> None:
             self.messages: list[dict] = []
 
-        async def send_json(self, message: dict) -> None:
-            self.messages.append(message)
+        async def send_text(self, data: str) -> None:
+            self.messages.append(json.loads(data))
 
     viewer = FakeViewer()
-    manager.viewers = cast(list, [viewer])
+    manager.viewers = cast(set, {viewer})
 
     await manager.handle_agent_event(
         "agent-1",
@@ -227,14 +231,12 @@ async def test_handle_agent_event_broadcasts_and_saves(tmp_path, monkeypatch):
     assert "trace_complete" in types
     assert "metrics_update" in types
 
-    traces = storage.list_traces(limit=5)
+    traces = server_storage.list_traces(limit=5)
     assert any(item["trace_id"] == "trace-4" for item in traces)
 
 
 @pytest.mark.asyncio
-async def test_connect_agent_and_disconnect(tmp_path, monkeypatch):
-    storage = TraceStorage(db_path=tmp_path / "traces.db")
-    monkeypatch.setattr(server, "storage", storage)
+async def test_connect_agent_and_disconnect(server_storage):
     manager = server.ConnectionManager()
 
     class FakeAgent:
@@ -255,31 +257,78 @@ async def test_connect_agent_and_disconnect(tmp_path, monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_broadcast_removes_failed_viewers(tmp_path, monkeypatch):
-    storage = TraceStorage(db_path=tmp_path / "traces.db")
-    monkeypatch.setattr(server, "storage", storage)
+async def test_broadcast_removes_failed_viewers(server_storage):
     manager = server.ConnectionManager()
 
     class GoodViewer:
         def __init__(self) -> None:
             self.messages = []
 
-        async def send_json(self, message: dict) -> None:
-            self.messages.append(message)
+        async def send_text(self, data: str) -> None:
+            self.messages.append(json.loads(data))
 
     class BadViewer:
-        async def send_json(self, _message: dict) -> None:
+        async def send_text(self, _data: str) -> None:
             raise RuntimeError("boom")
 
     good = GoodViewer()
     bad = BadViewer()
-    manager.viewers = cast(list, [good, bad])
+    manager.viewers = cast(set, {good, bad})
 
     await manager.broadcast_to_viewers({"type": "test"})
     assert good in manager.viewers
     assert bad not in manager.viewers
 
 
+@pytest.mark.asyncio
+async def test_broadcast_encodes_payload_once():
+    manager = server.ConnectionManager()
+
+    class RawViewer:
+        def __init__(self) -> None:
+            self.frames: list[str] = []
+
+        async def send_text(self, data: str) -> None:
+            self.frames.append(data)
+
+    first = RawViewer()
+    second = RawViewer()
+    manager.viewers = cast(set, {first, second})
+
+    await manager.broadcast_to_viewers({"type": "test", "value": "ü"})
+    assert first.frames[0] is second.frames[0]
+    assert json.loads(first.frames[0]) == {"type": "test", "value": "ü"}
+
+
+@pytest.mark.asyncio
+async def test_broadcast_sends_to_viewers_concurrently():
+    manager = server.ConnectionManager()
+    first_sending = asyncio.Event()
+    second_sending = asyncio.Event()
+
+    class WaitingViewer:
+        """Blocks in send_text until the other viewer has started sending."""
+
+        def __init__(self, started: asyncio.Event, other: asyncio.Event) -> None:
+            self.started = started
+            self.other = other
+            self.messages: list[dict] = []
+
+        async def send_text(self, data: str) -> None:
+            self.started.set()
+            await self.other.wait()
+            self.messages.append(json.loads(data))
+
+    first = WaitingViewer(first_sending, second_sending)
+    second = WaitingViewer(second_sending, first_sending)
+    manager.viewers = cast(set, {first, second})
+
+    # A sequential fan-out would block forever on the first viewer.
+    await asyncio.wait_for(manager.broadcast_to_viewers({"type": "test"}), 1.0)
+    assert first.messages == [{"type": "test"}]
+    assert second.messages == [{"type": "test"}]
+
+
 def test_calculate_metrics_from_state_exception():
     # Pass malformed state that will raise during from_dict
     bad_state = {"trace_id": "test", "executions": "not-a-list"}
@@ -287,10 +336,7 @@ def test_calculate_metrics_from_state_exception():
     assert metrics is None
 
 
-def test_save_trace_state_exception(tmp_path, monkeypatch):
-    storage = TraceStorage(db_path=tmp_path / "traces.db")
-    monkeypatch.setattr(server, "storage", storage)
-
+def test_save_trace_state_exception(server_storage):
     # Malformed state that will raise during from_dict
     bad_state = {"trace_id": "test", "executions": "not-a-list"}
     # Should not raise, just log exception
@@ -335,7 +381,7 @@ async def test_viewer_websocket_disconnect():
             return "{}"
 
     viewer_ws = FakeViewerWS()
-    manager.viewers = []
+    manager.viewers = set()
 
     # Run the websocket handler which should handle disconnect
     try:
@@ -366,7 +412,7 @@ async def test_viewer_websocket_exception():
             raise RuntimeError("test error")
 
     viewer_ws = FakeViewerWS()
-    manager.viewers = []
+    manager.viewers = set()
 
     # Run the websocket handler which should handle exception
     await server.viewer_websocket(viewer_ws)  # type: ignore[arg-type]
@@ -428,6 +474,34 @@ async def test_agent_websocket_exception():
     assert agent_ws not in manager.agents
 
 
+@pytest.mark.asyncio
+async def test_agent_websocket_parses_incoming_events(monkeypatch):
+    from fastapi import WebSocketDisconnect
+
+    received: list[dict] = []
+
+    async def fake_handle_agent_event(agent_id: str, event: dict) -> None:
+        received.append(event)
+
+    monkeypatch.setattr(server.manager, "handle_agent_event", fake_handle_agent_event)
+
+    class FakeAgentWS:
+        def __init__(self) -> None:
+            self.frames = ['{"type": "tick_started", "data": {"tick": 1}}']
+
+        async def accept(self) -> None:
+            pass
+
+        async def receive_text(self) -> str:
+            if not self.frames:
+                raise WebSocketDisconnect()
+            return self.frames.pop(0)
+
+    await server.agent_websocket(FakeAgentWS())  # type: ignore[arg-type]
+
+    assert received == [{"type": "tick_started", "data": {"tick": 1}}]
+
+
 def test_index_returns_fallback_when_no_static(monkeypatch):
     """index() should return fallback HTML when static file doesn't exist."""
     from pathlib import Path
@@ -463,11 +537,11 @@ async def test_broadcast_to_agents_cleanup():
         def __init__(self) -> None:
             self.messages = []
 
-        async def send_json(self, message: dict) -> None:
-            self.messages.append(message)
+        async def send_text(self, data: str) -> None:
+            self.messages.append(json.loads(data))
 
     class BadAgent:
-        async def send_json(self, _message: dict) -> None:
+        async def send_text(self, _data: str) -> None:
             raise RuntimeError("boom")
 
     good = GoodAgent()
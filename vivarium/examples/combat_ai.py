@@ -22,10 +22,13 @@ Options:
     --damage-taken INT    Damage taken per attack (0-50, default: random)
     --passive-enemy       Enemy doesn't counterattack (default: active)
     --seed INT            Random seed for reproducibility
+    --quiet               Only print the configuration and final summary
 """
 
 import argparse
+import logging
 import random
+import sys
 
 from vivarium import (
     Action,
@@ -37,6 +40,10 @@ from vivarium import (
     State,
 )
 
+# Nodes narrate through logging so that running the tree costs no I/O unless
+# main() enables it.
+logger = logging.getLogger(__name__)
+
 # Conditions
 
 
@@ -50,8 +57,12 @@ class LowHealthCondition(Condition):
     def evaluate(self, state) -> bool:
         health = state.get("health", 0)
         is_low = health < self.threshold
-        print(
-            f"  [{self.name}] Health={health}, threshold={self.threshold}, low={is_low}"
+        logger.info(
+            "  [%s] Health=%s, threshold=%s, low=%s",
+            self.name,
+            health,
+            self.threshold,
+            is_low,
         )
         return is_low
 
@@ -72,9 +83,12 @@ class HealAction(Action):
         state["health"] = new_health
         state["last_action"] = "heal"
         state["heal_count"] = state.get("heal_count", 0) + 1
-        print(
-            f"  [{self.name}] Healed {new_health - old_health} "
-            f"HP: {old_health} -> {new_health}"
+        logger.info(
+            "  [%s] Healed %s HP: %s -> %s",
+            self.name,
+            new_health - old_health,
+            old_health,
+            new_health,
         )
         return NodeStatus.SUCCESS
 
@@ -110,9 +124,12 @@ class AttackAction(Action):
         state["last_action"] = "attack"
         state["attack_count"] = state.get("attack_count", 0) + 1
 
-        print(
-            f"  [{self.name}] Attacked for {self.damage_dealt} damage, "
-            f"{damage_msg}, enemy health -> {enemy_health}"
+        logger.info(
+            "  [%s] Attacked for %s damage, %s, enemy health -> %s",
+            self.name,
+            self.damage_dealt,
+            damage_msg,
+            enemy_health,
         )
         return NodeStatus.SUCCESS
 
@@ -171,6 +188,9 @@ Examples:
 
   # Run with reproducible random values
   python examples/combat_ai.py --seed 42
+
+  # Skip the per-tick narration
+  python examples/combat_ai.py --quiet
         """,
     )
     parser.add_argument(
@@ -208,12 +228,22 @@ Examples:
         default=None,
         help="Random seed for reproducibility",
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only print the configuration and final summary",
+    )
     return parser.parse_args()
 
 
 def main():
     """Run the combat AI example."""
     args = parse_args()
+    logging.basicConfig(
+        stream=sys.stdout,
+        level=logging.WARNING if args.quiet else logging.INFO,
+        format="%(message)s",
+    )
 
     # Set random seed if provided
     if args.seed is not None:
@@ -281,17 +311,20 @@ def main():
     num_ticks = 50  # Increased to allow for longer battles
     tick = 0
     for tick in range(1, num_ticks + 1):
-        print("=" * 60)
-        print(f"Tick {tick} (tree tick_count: {tree.tick_count})")
-        print("=" * 60)
+        if args.quiet:
+            tree.tick(state)
+        else:
+            print("=" * 60)
+            print(f"Tick {tick} (tree tick_count: {tree.tick_count})")
+            print("=" * 60)
 
-        print("Executing tree:")
-        result = tree.tick(state)
-        print(f"  Result: {result.value}")
-        print()
+            print("Executing tree:")
+            result = tree.tick(state)
+            print(f"  Result: {result.value}")
+            print()
 
-        print_state(state, "State after tick")
-        print()
+            print_state(state, "State after tick")
+            print()
 
         # Check win/lose conditions
         if state.get("health", 0) <= 0:
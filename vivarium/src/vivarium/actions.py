@@ -45,6 +45,8 @@ class Action(Node):
         name: A unique identifier for this action.
     """
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         """Initialize the Action with a name.
 
@@ -32,6 +32,8 @@ class Sequence(Node):
         current_index: Index of the child currently being executed.
     """
 
+    __slots__ = ("name", "children", "current_index")
+
     def __init__(self, name: str, children: SequenceType[Node] | None = None):
         """Initialize the Sequence node.
 
@@ -89,30 +91,40 @@ class Sequence(Node):
                 )
             return result
 
-        while self.current_index < len(self.children):
-            child = self.children[self.current_index]
+        # Hoist loop-invariant lookups out of the per-child loop.
+        children = self.children
+        success = NodeStatus.SUCCESS
+        failure = NodeStatus.FAILURE
+        running = NodeStatus.RUNNING
+        tracing = emitter is not None and node_ctx is not None
+        index = self.current_index
+        count = len(children)
+
+        while index < count:
+            child = children[index]
 
             # Create child context with position index
             child_ctx = None
-            if emitter is not None and node_ctx is not None:
+            if tracing:
                 child_name = getattr(child, "name", type(child).__name__)
                 child_type = type(child).__name__
-                child_ctx = node_ctx.child(child_name, child_type, self.current_index)
+                child_ctx = node_ctx.child(child_name, child_type, index)
 
             status = child.tick(state, emitter, child_ctx)
 
-            if status == NodeStatus.FAILURE:
+            if status is failure:
                 self.current_index = 0
-                return emit_exit(NodeStatus.FAILURE)
-            elif status == NodeStatus.RUNNING:
-                return emit_exit(NodeStatus.RUNNING)
-            elif status == NodeStatus.SUCCESS:
-                self.current_index += 1
+                return emit_exit(failure)
+            elif status is running:
+                return emit_exit(running)
+            elif status is success:
+                index += 1
+                self.current_index = index
             else:
                 _raise_idle_error(child)
 
         self.current_index = 0
-        return emit_exit(NodeStatus.SUCCESS)
+        return emit_exit(success)
 
     def reset(self):
         """Reset this node and all children to their initial state."""
@@ -137,6 +149,8 @@ class Selector(Node):
         current_index: Index of the child currently being executed.
     """
 
+    __slots__ = ("name", "children", "current_index")
+
     def __init__(self, name: str, children: SequenceType[Node] | None = None):
         """Initialize the Selector node.
 
@@ -194,30 +208,40 @@ class Selector(Node):
                 )
             return result
 
-        while self.current_index < len(self.children):
-            child = self.children[self.current_index]
+        # Hoist loop-invariant lookups out of the per-child loop.
+        children = self.children
+        success = NodeStatus.SUCCESS
+        failure = NodeStatus.FAILURE
+        running = NodeStatus.RUNNING
+        tracing = emitter is not None and node_ctx is not None
+        index = self.current_index
+        count = len(children)
+
+        while index < count:
+            child = children[index]
 
             # Create child context with position index
             child_ctx = None
-            if emitter is not None and node_ctx is not None:
+            if tracing:
                 child_name = getattr(child, "name", type(child).__name__)
                 child_type = type(child).__name__
-                child_ctx = node_ctx.child(child_name, child_type, self.current_index)
+                child_ctx = node_ctx.child(child_name, child_type, index)
 
             status = child.tick(state, emitter, child_ctx)
 
-            if status == NodeStatus.SUCCESS:
+            if status is success:
                 self.current_index = 0
-                return emit_exit(NodeStatus.SUCCESS)
-            elif status == NodeStatus.RUNNING:
-                return emit_exit(NodeStatus.RUNNING)
-            elif status == NodeStatus.FAILURE:
-                self.current_index += 1
+                return emit_exit(success)
+            elif status is running:
+                return emit_exit(running)
+            elif status is failure:
+                index += 1
+                self.current_index = index
             else:
                 _raise_idle_error(child)
 
         self.current_index = 0
-        return emit_exit(NodeStatus.FAILURE)
+        return emit_exit(failure)
 
     def reset(self):
         """Reset this node and all children to their initial state."""
@@ -249,6 +273,14 @@ class Parallel(Node):
             to fail. If None, all children must fail.
     """
 
+    __slots__ = (
+        "name",
+        "children",
+        "success_threshold",
+        "failure_threshold",
+        "_child_statuses",
+    )
+
     def __init__(
         self,
         name: str,
@@ -277,40 +309,6 @@ class Parallel(Node):
         while len(self._child_statuses) < len(self.children):
             self._child_statuses.append(None)
 
-    def _tick_child(
-        self,
-        index: int,
-        child: Node,
-        state,
-        emitter: "EventEmitter | None" = None,
-        node_ctx: "ExecutionContext | None" = None,
-    ) -> NodeStatus:
-        """Tick a child if not already completed, updating cached status.
-
-        Args:
-            index: Index of the child in the children list.
-            child: The child node to tick.
-            state: The current state of the behavior tree.
-            emitter: Optional event emitter for observation.
-            node_ctx: Optional execution context for this Parallel node.
-
-        Returns:
-            The child's status (cached if already completed).
-
-        Raises:
-            ValueError: If the child returns IDLE.
-        """
-        cached = self._child_statuses[index]
-        if cached in (NodeStatus.SUCCESS, NodeStatus.FAILURE):
-            return cached  # type: ignore[return-value]
-
-        status = child.tick(state, emitter, node_ctx)
-        self._child_statuses[index] = status
-
-        if status == NodeStatus.IDLE:
-            _raise_idle_error(child)
-        return status
-
     def _evaluate_thresholds(
         self, success_count: int, failure_count: int, running_count: int
     ) -> NodeStatus:
@@ -390,20 +388,34 @@ class Parallel(Node):
 
         self._ensure_status_list_size()
 
+        # Hoist loop-invariant lookups out of the per-child loop.
+        statuses = self._child_statuses
+        success = NodeStatus.SUCCESS
+        failure = NodeStatus.FAILURE
+        tracing = emitter is not None and node_ctx is not None
+
         success_count = 0
         failure_count = 0
         running_count = 0
 
         for i, child in enumerate(self.children):
-            child_ctx = None
-            if emitter is not None and node_ctx is not None:
-                child_name = getattr(child, "name", type(child).__name__)
+            # Children that already completed keep their cached status.
+            status = statuses[i]
+            if status is not success and status is not failure:
                 child_type = type(child).__name__
-                child_ctx = node_ctx.child(child_name, child_type, i)
-            status = self._tick_child(i, child, state, emitter, child_ctx)
-            if status == NodeStatus.SUCCESS:
+                child_ctx = (
+                    node_ctx.child(getattr(child, "name", child_type), child_type, i)
+                    if tracing
+                    else None
+                )
+                status = child.tick(state, emitter, child_ctx)
+                statuses[i] = status
+                if status is NodeStatus.IDLE:
+                    _raise_idle_error(child)
+
+            if status is success:
                 success_count += 1
-            elif status == NodeStatus.FAILURE:
+            elif status is failure:
                 failure_count += 1
             else:
                 running_count += 1
@@ -24,6 +24,10 @@ if TYPE_CHECKING:
 from .node import Node
 from .status import NodeStatus
 
+# Module-level aliases save an attribute lookup on every tick.
+_SUCCESS = NodeStatus.SUCCESS
+_FAILURE = NodeStatus.FAILURE
+
 
 class Condition(Node):
     """Abstract base class for condition nodes in a behavior tree.
@@ -40,6 +44,8 @@ class Condition(Node):
         name: A unique identifier for this condition.
     """
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         """Initialize the Condition with a name.
 
@@ -84,7 +90,7 @@ class Condition(Node):
             FAILURE if evaluate() returns False.
         """
         bool_result = self.evaluate(state)
-        status = NodeStatus.SUCCESS if bool_result else NodeStatus.FAILURE
+        status = _SUCCESS if bool_result else _FAILURE
 
         if emitter is not None and ctx is not None:
             emitter.emit(
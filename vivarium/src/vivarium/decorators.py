@@ -15,6 +15,11 @@ from .events import EventEmitter, NodeEntered, NodeExited
 from .node import Node
 from .status import NodeStatus
 
+# Module-level aliases save an attribute lookup on every tick.
+_SUCCESS = NodeStatus.SUCCESS
+_FAILURE = NodeStatus.FAILURE
+_RUNNING = NodeStatus.RUNNING
+
 
 class Decorator(Node):
     """Abstract base class for decorator nodes.
@@ -27,6 +32,8 @@ class Decorator(Node):
         child: The single child node being decorated.
     """
 
+    __slots__ = ("name", "child")
+
     def __init__(self, name: str, child: Node):
         """Initialize the decorator with a name and child node.
 
@@ -121,6 +128,8 @@ class Inverter(Decorator):
     an action's success/failure semantics.
     """
 
+    __slots__ = ()
+
     def tick(
         self,
         state,
@@ -143,10 +152,10 @@ class Inverter(Decorator):
 
         child_status = self.child.tick(state, emitter, self._child_ctx(emitter, ctx))
 
-        if child_status == NodeStatus.SUCCESS:
-            result = NodeStatus.FAILURE
-        elif child_status == NodeStatus.FAILURE:
-            result = NodeStatus.SUCCESS
+        if child_status is _SUCCESS:
+            result = _FAILURE
+        elif child_status is _FAILURE:
+            result = _SUCCESS
         else:
             result = child_status
 
@@ -172,6 +181,8 @@ class Repeater(Decorator):
         current_count: Number of completed repetitions so far.
     """
 
+    __slots__ = ("max_repeats", "current_count")
+
     def __init__(self, name: str, child: Node, max_repeats: int | None = None):
         """Initialize the Repeater.
 
@@ -210,14 +221,14 @@ class Repeater(Decorator):
 
         child_status = self.child.tick(state, emitter, self._child_ctx(emitter, ctx))
 
-        if child_status == NodeStatus.FAILURE:
-            result = NodeStatus.FAILURE
+        if child_status is _FAILURE:
+            result = _FAILURE
             self.current_count = 0
             self._emit_exited("Repeater", result, emitter, ctx)
             return result
 
-        if child_status == NodeStatus.RUNNING:
-            result = NodeStatus.RUNNING
+        if child_status is _RUNNING:
+            result = _RUNNING
             self._emit_exited("Repeater", result, emitter, ctx)
             return result
 
@@ -226,13 +237,13 @@ class Repeater(Decorator):
         self.child.reset()
 
         if self.max_repeats is not None and self.current_count >= self.max_repeats:
-            result = NodeStatus.SUCCESS
+            result = _SUCCESS
             self.current_count = 0
             self._emit_exited("Repeater", result, emitter, ctx)
             return result
 
         # More repetitions needed
-        result = NodeStatus.RUNNING
+        result = _RUNNING
         self._emit_exited("Repeater", result, emitter, ctx)
         return result
 
@@ -259,6 +270,8 @@ class RetryUntilSuccess(Decorator):
         current_attempts: Number of attempts so far.
     """
 
+    __slots__ = ("max_attempts", "current_attempts")
+
     def __init__(self, name: str, child: Node, max_attempts: int | None = None):
         """Initialize RetryUntilSuccess.
 
@@ -294,14 +307,14 @@ class RetryUntilSuccess(Decorator):
 
         child_status = self.child.tick(state, emitter, self._child_ctx(emitter, ctx))
 
-        if child_status == NodeStatus.SUCCESS:
-            result = NodeStatus.SUCCESS
+        if child_status is _SUCCESS:
+            result = _SUCCESS
             self.current_attempts = 0
             self._emit_exited("RetryUntilSuccess", result, emitter, ctx)
             return result
 
-        if child_status == NodeStatus.RUNNING:
-            result = NodeStatus.RUNNING
+        if child_status is _RUNNING:
+            result = _RUNNING
             self._emit_exited("RetryUntilSuccess", result, emitter, ctx)
             return result
 
@@ -310,13 +323,13 @@ class RetryUntilSuccess(Decorator):
         self.child.reset()
 
         if self.max_attempts is not None and self.current_attempts >= self.max_attempts:
-            result = NodeStatus.FAILURE
+            result = _FAILURE
             self.current_attempts = 0
             self._emit_exited("RetryUntilSuccess", result, emitter, ctx)
             return result
 
         # More attempts available
-        result = NodeStatus.RUNNING
+        result = _RUNNING
         self._emit_exited("RetryUntilSuccess", result, emitter, ctx)
         return result
 
@@ -15,6 +15,10 @@ class Node(ABC):
     the required abstract methods: __init__, tick, and reset.
     """
 
+    # Only __weakref__, so that subclasses declaring __slots__ get no
+    # per-instance dict but can still be weakly referenced.
+    __slots__ = ("__weakref__",)
+
     @abstractmethod
     def __init__(self, name: str):
         """Initialize the node with a name.
@@ -32,6 +32,8 @@ class State:
         50
     """
 
+    __slots__ = ("_data", "__weakref__")
+
     def __init__(self, data: dict[str, Any] | None = None):
         """Initialize the State with optional initial data.
 
@@ -63,8 +65,9 @@ class State:
             key: The key to set.
             value: The value to store.
         """
-        # Convert nested dicts to State objects
-        if isinstance(value, dict) and not isinstance(value, State):
+        # Convert nested dicts (including dict subclasses) to State objects.
+        # State is not a dict, so it never matches.
+        if isinstance(value, dict):
             value = State(value)
         self._data[key] = value
 
@@ -88,12 +91,15 @@ class State:
         if key.startswith("_"):
             raise AttributeError(f"'{type(self).__name__}' has no attribute '{key}'")
 
-        if key in self._data:
-            return self._data[key]
+        data = self._data
+        try:
+            return data[key]
+        except KeyError:
+            pass
 
         # Create nested State for undefined keys to support chaining
         nested = State()
-        self._data[key] = nested
+        data[key] = nested
         return nested
 
     def __setattr__(self, key: str, value: Any) -> None:
@@ -162,4 +168,4 @@ class State:
 
     def __repr__(self) -> str:
         """Return string representation of state."""
-        return f"State({self.to_dict()!r})"
+        return f"State({self._data!r})"
@@ -4,6 +4,9 @@ The BehaviorTree class provides a container for behavior tree execution,
 wrapping the root node and providing tick counting and state management.
 """
 
+from collections.abc import Callable
+from typing import Any
+
 from .context import ExecutionContext
 from .events import Event, EventEmitter, TickCompleted, TickStarted
 from .node import Node, NodeStatus
@@ -65,6 +68,49 @@ class BehaviorTree:
         self._emit(TickCompleted(tick_id=self.tick_count, result=result))
         return result
 
+    def run_until(
+        self,
+        state,
+        predicate: Callable[[Any, NodeStatus], bool],
+        max_ticks: int = 10_000,
+    ) -> NodeStatus:
+        """Tick the tree repeatedly until a predicate is satisfied.
+
+        Equivalent to calling tick() in a loop and checking predicate after
+        each tick, but without an emitter the loop calls the root directly,
+        skipping the per-tick overhead of tick(). tick_count is updated
+        either way.
+
+        Args:
+            state: The current state to pass through the tree.
+            predicate: Called after each tick with the state and the root's
+                status; ticking stops as soon as it returns True.
+            max_ticks: Maximum number of ticks to run.
+
+        Returns:
+            The status returned by the last tick.
+
+        Raises:
+            ValueError: If max_ticks is less than 1.
+        """
+        if max_ticks < 1:
+            raise ValueError(f"max_ticks must be at least 1, got {max_ticks}")
+
+        if self._emitter is not None:
+            for _ in range(max_ticks):
+                result = self.tick(state)
+                if predicate(state, result):
+                    break
+            return result
+
+        root_tick = self.root.tick
+        for _ in range(max_ticks):
+            self.tick_count += 1
+            result = root_tick(state)
+            if predicate(state, result):
+                break
+        return result
+
     def reset(self) -> None:
         """Reset the behavior tree traversal state.
 
@@ -1,3 +1,5 @@
+import weakref
+
 import pytest
 
 from vivarium import (
@@ -201,6 +203,14 @@ class TestSequence:
             seq.tick({})
         assert "NamelessNode" in str(exc_info.value)
 
+    def test_sequence_has_no_instance_dict(self):
+        seq = Sequence("seq")
+        assert not hasattr(seq, "__dict__")
+
+    def test_sequence_supports_weak_references(self):
+        seq = Sequence("seq")
+        assert weakref.ref(seq)() is seq
+
 
 class TestSelector:
     def test_empty_selector_returns_failure(self):
@@ -630,6 +640,10 @@ class TestParallel:
             par.tick({})
         assert "NamelessNode" in str(exc_info.value)
 
+    def test_parallel_has_no_instance_dict(self):
+        par = Parallel("par")
+        assert not hasattr(par, "__dict__")
+
 
 @pytest.mark.integration
 class TestNestedComposites:
@@ -46,6 +46,15 @@ class TestDecoratorBase:
         dec.reset()
         assert child._reset_called
 
+    def test_decorators_have_no_instance_dict(self):
+        child = MockNode("child")
+        for dec in (
+            Inverter("inv", child),
+            Repeater("rep", child),
+            RetryUntilSuccess("retry", child),
+        ):
+            assert not hasattr(dec, "__dict__")
+
 
 # =============================================================================
 # Inverter
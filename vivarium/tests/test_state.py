@@ -1,3 +1,7 @@
+import copy
+import weakref
+from collections import OrderedDict
+
 import pytest
 
 from vivarium import NodeStatus, Sequence, State
@@ -78,6 +82,10 @@ class TestStateBasicOperations:
         assert state.get("health") == 100
         assert state.get("name") == "player"
 
+    def test_supports_weak_references(self):
+        state = State()
+        assert weakref.ref(state)() is state
+
 
 class TestStateDotNotation:
     """Test dot notation access."""
@@ -108,6 +116,17 @@ class TestStateDotNotation:
         state["mana"] = 50
         assert state.mana == 50
 
+    def test_state_has_no_instance_dict(self):
+        state = State()
+        assert not hasattr(state, "__dict__")
+
+    def test_deepcopy_preserves_nested_values(self):
+        state = State({"player": {"health": 50}})
+        clone = copy.deepcopy(state)
+        clone.player.health = 10
+        assert state.player.health == 50
+        assert clone.to_dict() == {"player": {"health": 10}}
+
 
 class TestStateNestedAccess:
     """Test nested state access."""
@@ -134,6 +153,18 @@ class TestStateNestedAccess:
         assert state.player.health == 100
         assert state.player.mana == 50
 
+    def test_dict_subclass_converted_to_state(self):
+        state = State()
+        state.set("player", OrderedDict(health=100))
+        assert isinstance(state.player, State)
+        assert state.player.health == 100
+
+    def test_nested_state_stored_as_is(self):
+        player = State({"health": 100})
+        state = State()
+        state.set("player", player)
+        assert state.player is player
+
     def test_init_with_nested_dict(self):
         state = State({"player": {"health": 100, "mana": 50}})
         assert state.player.health == 100
@@ -165,6 +196,10 @@ class TestStateRepr:
         assert "State" in repr_str
         assert "health" in repr_str
 
+    def test_repr_shows_nested_state(self):
+        state = State({"player": {"health": 100}})
+        assert repr(state) == "State({'player': State({'health': 100})})"
+
 
 @pytest.mark.integration
 class TestStateWithNodes:
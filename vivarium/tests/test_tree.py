@@ -169,6 +169,57 @@ class TestBehaviorTreeMultipleTicks:
         assert state["counter"] == 6
 
 
+class TestBehaviorTreeRunUntil:
+    """Test running the tree until a predicate holds."""
+
+    def test_stops_when_predicate_is_true(self):
+        tree = BehaviorTree(IncrementAction("inc", "counter"))
+        state = {"counter": 0}
+
+        result = tree.run_until(state, lambda s, _: s["counter"] >= 5)
+
+        assert result == NodeStatus.SUCCESS
+        assert state["counter"] == 5
+        assert tree.tick_count == 5
+
+    def test_predicate_receives_status(self):
+        tree = BehaviorTree(RunningAction("run"))
+        seen = []
+
+        def predicate(state, status):
+            seen.append(status)
+            return True
+
+        tree.run_until({}, predicate)
+
+        assert seen == [NodeStatus.RUNNING]
+
+    def test_stops_at_max_ticks(self):
+        tree = BehaviorTree(IncrementAction("inc", "counter"))
+        state = {"counter": 0}
+
+        tree.run_until(state, lambda s, _: False, max_ticks=3)
+
+        assert state["counter"] == 3
+        assert tree.tick_count == 3
+
+    def test_emits_tick_events_with_emitter(self):
+        emitter = ListEventEmitter()
+        tree = BehaviorTree(IncrementAction("inc", "counter"), emitter=emitter)
+        state = {"counter": 0}
+
+        tree.run_until(state, lambda s, _: s["counter"] >= 2)
+
+        started = [e for e in emitter.events if isinstance(e, TickStarted)]
+        assert [e.tick_id for e in started] == [1, 2]
+        assert tree.tick_count == 2
+
+    def test_invalid_max_ticks_raises(self):
+        tree = BehaviorTree(SuccessAction("ok"))
+        with pytest.raises(ValueError, match="max_ticks"):
+            tree.run_until({}, lambda s, _: True, max_ticks=0)
+
+
 class TestBehaviorTreeReset:
     """Test reset functionality."""
 